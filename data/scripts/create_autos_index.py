@@ -1,19 +1,34 @@
 """Create Elasticsearch index for AUTOS project"""
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, __version__ as ES_CLIENT_VERSION
+import argparse
 import sys
 
-def create_autos_index():
+
+def connect_to_elasticsearch():
+    """Create a gzip-compressed client for the AUTOS cluster"""
+    # request_timeout and es.options() are elasticsearch-py 8 APIs; fail before any request
+    if ES_CLIENT_VERSION[0] < 8:
+        version = ".".join(str(part) for part in ES_CLIENT_VERSION)
+        raise RuntimeError(f"elasticsearch-py >= 8 is required (found {version})")
+    return Elasticsearch(
+        ['http://thor:30398'],
+        http_compress=True,
+        request_timeout=60
+    )
+
+
+def create_autos_index(assume_yes=False, bulk_load=False):
     """Create autos-unified index with mappings"""
     
     # Connect to Elasticsearch
-    es = Elasticsearch(['http://thor:30398'])
+    es = connect_to_elasticsearch()
     
     index_name = "autos-unified"
     
     # Check if index already exists
     if es.indices.exists(index=index_name):
         print(f"⚠️  Index '{index_name}' already exists")
-        response = input("Delete and recreate? (yes/no): ")
+        response = 'yes' if assume_yes else input("Delete and recreate? (yes/no): ")
         if response.lower() == 'yes':
             es.indices.delete(index=index_name)
             print(f"🗑️  Deleted existing index")
@@ -87,6 +102,14 @@ def create_autos_index():
         }
     }
     
+    # Bulk-load friendly; finalize_autos_index() restores these after ingest
+    if bulk_load:
+        index_body["settings"]["refresh_interval"] = "-1"
+        index_body["settings"]["translog"] = {
+            "durability": "async",
+            "sync_interval": "30s"
+        }
+    
     # Create the index
     es.indices.create(index=index_name, body=index_body)
     print(f"✅ Created index: {index_name}")
@@ -121,14 +144,54 @@ def create_autos_index():
     print(f"✅ Test document cleaned up")
     
     print(f"\n✅ Index '{index_name}' is ready for data!")
+    if bulk_load:
+        print("⚠️  Bulk-load settings active: refresh disabled, translog async")
+        print("   Searches return stale results until you run with --finalize after loading")
+
+
+def finalize_autos_index():
+    """Restore refresh/translog settings and force-merge after bulk load"""
+    
+    es = connect_to_elasticsearch()
+    
+    index_name = "autos-unified"
+    
+    es.indices.put_settings(index=index_name, body={
+        "index": {
+            "refresh_interval": "1s",
+            "translog": {"durability": "request"}
+        }
+    })
+    print(f"✅ Restored refresh_interval and translog durability")
+    
+    # Merging to one segment can take minutes on a fully loaded index
+    es.options(request_timeout=3600).indices.forcemerge(index=index_name, max_num_segments=1)
+    es.indices.refresh(index=index_name)
+    print(f"✅ Force-merged '{index_name}' to a single segment")
 
 
 if __name__ == "__main__":
-    print("\n🔧 Creating Elasticsearch Index for AUTOS\n")
+    parser = argparse.ArgumentParser(description="Create Elasticsearch index for AUTOS")
+    parser.add_argument("--yes", action="store_true",
+                        help="delete and recreate an existing index without prompting")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--bulk-load", action="store_true",
+                      help="create with refresh disabled and async translog (run --finalize after loading)")
+    mode.add_argument("--finalize", action="store_true",
+                      help="restore search settings after bulk load instead of creating")
+    args = parser.parse_args()
+    if args.finalize and args.yes:
+        parser.error("--yes only applies when creating the index")
+    
+    action = "Finalizing" if args.finalize else "Creating"
+    print(f"\n🔧 {action} Elasticsearch Index for AUTOS\n")
     print("=" * 60)
     
     try:
-        create_autos_index()
+        if args.finalize:
+            finalize_autos_index()
+        else:
+            create_autos_index(assume_yes=args.yes, bulk_load=args.bulk_load)
         print("=" * 60)
         print("\n✅ Setup complete!\n")
     except Exception as e: